@@ -1,6 +1,5 @@
 from typing import cast
 import numpy as np
-from scipy.signal import butter, lfilter
 
 
 def bandpass_filter(
@@ -17,6 +16,8 @@ def bandpass_filter(
     Returns:
         Filtered signal array
     """
+    from scipy.signal import butter, lfilter
+
     nyquist = 0.5 * sampling_frequency
     low = lowcut / nyquist
     high = highcut / nyquist
@@ -37,6 +38,8 @@ def lowpass_filter(
     Returns:
         Filtered signal array
     """
+    from scipy.signal import butter, lfilter
+
     nyquist = 0.5 * sampling_frequency
     high = highcut / nyquist
     b, a = butter(5, high, btype="low")
@@ -56,6 +59,8 @@ def highpass_filter(
     Returns:
         Filtered signal array
     """
+    from scipy.signal import butter, lfilter
+
     nyquist = 0.5 * sampling_frequency
     low = lowcut / nyquist
     b, a = butter(5, low, btype="high")
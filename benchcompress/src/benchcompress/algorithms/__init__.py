@@ -5,6 +5,7 @@ from .ans import algorithms as ans_algorithms
 from .lzma import algorithms as lzma_algorithms
 from .brotli import algorithms as brotli_algorithms
 from .lz4 import algorithms as lz4_algorithms
+from .bitshuffle_zstd import algorithms as bitshuffle_zstd_algorithms
 
 algorithms = (
     bzip2_algorithms
@@ -14,4 +15,5 @@ algorithms = (
     + lzma_algorithms
     + brotli_algorithms
     + lz4_algorithms
+    + bitshuffle_zstd_algorithms
 )
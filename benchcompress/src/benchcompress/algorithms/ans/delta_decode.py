@@ -0,0 +1,32 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _prefix_sum(diffs, x0, out):
+    acc = x0
+    out[0] = acc
+    for i in range(diffs.shape[0]):
+        acc += diffs[i]
+        out[i + 1] = acc
+
+
+def delta_decode(diffs: np.ndarray, x0) -> np.ndarray:
+    """Reconstruct a signal from its first value and successive differences.
+
+    Args:
+        diffs: Differences between consecutive samples (length N - 1)
+        x0: First sample of the signal
+
+    Returns:
+        np.ndarray: Reconstructed signal of length N with the same dtype as diffs.
+                   Arithmetic wraps around in that dtype, matching np.diff.
+    """
+    out = np.empty(len(diffs) + 1, dtype=diffs.dtype)
+    if diffs.dtype == np.int16 or diffs.dtype == np.int32:
+        _prefix_sum(diffs, int(x0), out)
+    else:
+        out[0] = x0
+        out[1:] = diffs
+        np.cumsum(out, dtype=out.dtype, out=out)
+    return out
@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def delta_encode(x: np.ndarray) -> np.ndarray:
+    """Compute the first value of a signal followed by its successive differences.
+
+    Args:
+        x: Input signal (1D)
+
+    Returns:
+        np.ndarray: Array of the same length and dtype as x, where element 0 is x[0]
+                   and element i is x[i] - x[i - 1] (wrapping around in that dtype).
+    """
+    # Subtract straight into one preallocated buffer; np.diff followed by
+    # np.insert would allocate and copy the whole signal twice
+    out = np.empty_like(x)
+    if len(x) > 0:
+        out[0] = x[0]
+        np.subtract(x[1:], x[:-1], out=out[1:])
+    return out
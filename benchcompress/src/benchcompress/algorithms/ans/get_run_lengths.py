@@ -1,10 +1,56 @@
 import numpy as np
-from .get_run_lengths_cpp_ext import get_run_lengths_int16, get_run_lengths_int32
+
+try:
+    from .get_run_lengths_cpp_ext import get_run_lengths_int16, get_run_lengths_int32
+except ImportError:
+    get_run_lengths_int16 = None
+    get_run_lengths_int32 = None
+
+# Codes used to record the run length dtype in encoded headers
+RUN_LENGTH_DTYPE_TO_CODE = {
+    np.dtype("uint8"): 0,
+    np.dtype("uint16"): 1,
+    np.dtype("uint32"): 2,
+}
+CODE_TO_RUN_LENGTH_DTYPE = {v: k for k, v in RUN_LENGTH_DTYPE_TO_CODE.items()}
+
+
+def _get_run_lengths_numpy(x: np.ndarray) -> np.ndarray:
+    """Vectorized NumPy equivalent of the C++ get_run_lengths implementation.
+
+    A zero run is split out when it has at least 10 zeros or extends to the
+    end of the signal; shorter zero runs stay part of the non-zero runs.
+    """
+    N = len(x)
+    is_zero = np.concatenate([[0], (x == 0).view(np.int8), [0]])
+    changes = np.diff(is_zero)
+    zero_starts = np.flatnonzero(changes == 1)
+    zero_ends = np.flatnonzero(changes == -1)
+    keep = (zero_ends - zero_starts >= 10) | (zero_ends == N)
+    zero_starts = zero_starts[keep]
+    zero_ends = zero_ends[keep]
+
+    runs = np.empty(2 * len(zero_starts), dtype=np.int64)
+    runs[0::2] = zero_starts - np.concatenate([[0], zero_ends[:-1]])
+    runs[1::2] = zero_ends - zero_starts
+    last_end = zero_ends[-1] if len(zero_ends) > 0 else 0
+    if last_end < N:
+        runs = np.append(runs, N - last_end)
+
+    max_run = runs.max() if len(runs) > 0 else 0
+    if max_run < 256:
+        return runs.astype(np.uint8)
+    elif max_run < 65536:
+        return runs.astype(np.uint16)
+    else:
+        return runs.astype(np.uint32)
 
 
 def get_run_lengths(x: np.ndarray) -> np.ndarray:
     """Calculate run lengths of zeros and non-zeros in a signal using C++ implementation.
 
+    Falls back to a vectorized NumPy implementation if the C++ extension is not available.
+
     Args:
         x: Input signal (must be int16 or int32)
 
@@ -17,8 +63,29 @@ def get_run_lengths(x: np.ndarray) -> np.ndarray:
     """
     # Check input dtype and call appropriate implementation
     if x.dtype == np.int16:
+        if get_run_lengths_int16 is None:
+            return _get_run_lengths_numpy(x)
         return get_run_lengths_int16(x)
     elif x.dtype == np.int32:
+        if get_run_lengths_int32 is None:
+            return _get_run_lengths_numpy(x)
         return get_run_lengths_int32(x)
     else:
         raise ValueError(f"Input array must be int16 or int32, got {x.dtype}")
+
+
+def get_non_zero_mask(run_lengths: np.ndarray) -> np.ndarray:
+    """Compute a mask of the samples covered by the non-zero runs.
+
+    Note that this is not the same as x != 0, since short runs of zeros
+    are kept inside the non-zero runs.
+
+    Args:
+        run_lengths: Array of run lengths alternating between non-zero and zero runs,
+                     as returned by get_run_lengths
+
+    Returns:
+        np.ndarray: Boolean array over the full signal, True inside non-zero runs
+    """
+    is_non_zero_run = np.arange(len(run_lengths)) % 2 == 0
+    return np.repeat(is_non_zero_run, run_lengths)
@@ -1,13 +1,43 @@
 import numpy as np
-from .markov_reconstruct_cpp_ext import (
-    markov_reconstruct_int16,
-    markov_reconstruct_int32,
-)
+from numba import njit
+
+try:
+    from .markov_reconstruct_cpp_ext import (
+        markov_reconstruct_int16,
+        markov_reconstruct_int32,
+    )
+except ImportError:
+    markov_reconstruct_int16 = None
+    markov_reconstruct_int32 = None
+
+
+@njit(cache=True)
+def _markov_reconstruct_numba(coeffs, initial, resid):
+    # Mirrors markov_reconstruct.hpp, including its float32 arithmetic,
+    # so that the output is bit-identical to the C++ implementation
+    M = initial.shape[0] + 1
+    output = np.empty(resid.shape[0] + initial.shape[0], dtype=resid.dtype)
+    output[: initial.shape[0]] = initial
+    bias = coeffs[coeffs.shape[0] - 1]
+    for i in range(resid.shape[0]):
+        prediction = np.float32(0.0)
+        for j in range(M - 1):
+            prediction += coeffs[j] * np.float32(output[i + j])
+        prediction += bias
+        # std::round rounds halfway cases away from zero
+        if prediction >= 0:
+            rounded = np.float32(np.floor(np.float64(prediction) + 0.5))
+        else:
+            rounded = np.float32(-np.floor(-np.float64(prediction) + 0.5))
+        output[i + M - 1] = int(rounded + np.float32(resid[i]))
+    return output
 
 
 def markov_reconstruct(coeffs, initial, resid):
     """Reconstruct signal from Markov model parameters and residuals using C++ implementation.
 
+    Falls back to a numba implementation if the C++ extension is not available.
+
     Args:
         coeffs: Model coefficients from linear regression (float32)
         initial: Initial values needed for prediction (int16 or int32)
@@ -19,8 +49,8 @@ def markov_reconstruct(coeffs, initial, resid):
     Raises:
         ValueError: If initial/resid arrays are not int16 or int32, or if their dtypes don't match
     """
-    # Convert coeffs to float32 if needed
-    coeffs = coeffs.astype(np.float32)
+    # Convert coeffs to float32 if needed (no copy if already float32)
+    coeffs = np.asarray(coeffs, dtype=np.float32)
 
     # Check input dtypes
     if initial.dtype != resid.dtype:
@@ -30,8 +60,12 @@ def markov_reconstruct(coeffs, initial, resid):
 
     # Call appropriate implementation based on dtype
     if initial.dtype == np.int16:
+        if markov_reconstruct_int16 is None:
+            return _markov_reconstruct_numba(coeffs, initial, resid)
         return markov_reconstruct_int16(coeffs, initial, resid)
     elif initial.dtype == np.int32:
+        if markov_reconstruct_int32 is None:
+            return _markov_reconstruct_numba(coeffs, initial, resid)
         return markov_reconstruct_int32(coeffs, initial, resid)
     else:
         raise ValueError(
@@ -0,0 +1,94 @@
+import numpy as np
+import os
+from functools import lru_cache
+from ..zstd import zstd_encode, zstd_decode
+
+
+SOURCE_FILE = "bitshuffle_zstd/__init__.py"
+
+
+@lru_cache(maxsize=None)
+def _load_long_description():
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    md_path = os.path.join(current_dir, "bitshuffle_zstd.md")
+    with open(md_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def bitshuffle(x: np.ndarray) -> np.ndarray:
+    """Transpose the bits of an array into bit planes.
+
+    Args:
+        x: Input array
+
+    Returns:
+        np.ndarray: uint8 array of shape (8 * itemsize, ceil(N / 8)), where row k
+                   holds bit k (least significant first, in memory byte order) of
+                   every element, packed 8 elements per byte.
+    """
+    x = np.ascontiguousarray(x).reshape(-1)
+    bytes_2d = x.view(np.uint8).reshape(len(x), x.itemsize)
+    bits = np.unpackbits(bytes_2d, axis=1, bitorder="little")
+    return np.packbits(np.ascontiguousarray(bits.T), axis=1, bitorder="little")
+
+
+def bitunshuffle(planes: np.ndarray, dtype: str, num_elements: int) -> np.ndarray:
+    """Inverse of bitshuffle.
+
+    Args:
+        planes: Bit planes as returned by bitshuffle
+        dtype: Data type of the original array
+        num_elements: Number of elements in the original array
+
+    Returns:
+        np.ndarray: 1D array of the original values
+    """
+    bits = np.unpackbits(planes, axis=1, count=num_elements, bitorder="little")
+    bytes_2d = np.packbits(np.ascontiguousarray(bits.T), axis=1, bitorder="little")
+    return bytes_2d.view(dtype).reshape(-1)
+
+
+def bitshuffle_zstd_encode(x: np.ndarray, level: int) -> bytes:
+    return zstd_encode(bitshuffle(x), level=level)
+
+
+def bitshuffle_zstd_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
+    num_elements = int(np.prod(shape))
+    num_bits = 8 * np.dtype(dtype).itemsize
+    planes = zstd_decode(x, "uint8", (num_bits, (num_elements + 7) // 8))
+    y = bitunshuffle(planes, dtype, num_elements)
+    return y.reshape(shape)
+
+
+algorithms = [
+    {
+        "name": "bitshuffle-zstd-4",
+        "version": "2",
+        "encode": lambda x: bitshuffle_zstd_encode(x, level=4),
+        "decode": lambda x, dtype, shape: bitshuffle_zstd_decode(x, dtype, shape),
+        "description": "Bitshuffle followed by Zstandard compression at level 4.",
+        "tags": ["zstd", "bitshuffle"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "bitshuffle-zstd-13",
+        "version": "2",
+        "encode": lambda x: bitshuffle_zstd_encode(x, level=13),
+        "decode": lambda x, dtype, shape: bitshuffle_zstd_decode(x, dtype, shape),
+        "description": "Bitshuffle followed by Zstandard compression at level 13.",
+        "tags": ["zstd", "bitshuffle"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "bitshuffle-zstd-22",
+        "version": "2",
+        "encode": lambda x: bitshuffle_zstd_encode(x, level=22),
+        "decode": lambda x, dtype, shape: bitshuffle_zstd_decode(x, dtype, shape),
+        "description": "Bitshuffle followed by Zstandard compression at maximum level 22.",
+        "tags": ["zstd", "bitshuffle"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+]
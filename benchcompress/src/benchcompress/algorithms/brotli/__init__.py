@@ -1,11 +1,15 @@
 import numpy as np
 import brotli
 import os
+from functools import lru_cache
+from ..ans.delta_encode import delta_encode
+from ..ans.delta_decode import delta_decode
 
 
 SOURCE_FILE = "brotli/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "brotli.md")
@@ -13,14 +17,9 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def brotli_delta_encode(x: np.ndarray, level: int) -> bytes:
     assert x.ndim == 1
-    y = np.diff(x)
-    y = np.insert(y, 0, x[0])
-    buf = y.tobytes()
+    buf = delta_encode(x)
     compressed = brotli.compress(buf, quality=level)
     return compressed
 
@@ -29,11 +28,11 @@ def brotli_delta_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
     assert len(shape) == 1
     buf = brotli.decompress(x)
     y = np.frombuffer(buf, dtype=dtype)
-    return np.cumsum(y)
+    return delta_decode(y[1:], y[0])
 
 
 def brotli_encode(x: np.ndarray, level: int) -> bytes:
-    buf = x.tobytes()
+    buf = np.ascontiguousarray(x)
     compressed = brotli.compress(buf, quality=level)
     return compressed
 
@@ -53,7 +52,7 @@ algorithms = [
         "description": "Brotli compression at level 4 (faster).",
         "tags": ["brotli"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "brotli-6",
@@ -63,7 +62,7 @@ algorithms = [
         "description": "Brotli compression at level 6 (balanced).",
         "tags": ["brotli"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "brotli-8",
@@ -73,7 +72,7 @@ algorithms = [
         "description": "Brotli compression at level 8 (better compression).",
         "tags": ["brotli"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "brotli-11",
@@ -83,7 +82,7 @@ algorithms = [
         "description": "Brotli compression at maximum level 11.",
         "tags": ["brotli"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "brotli-11-delta",
@@ -93,6 +92,6 @@ algorithms = [
         "description": "Brotli compression at level 11 with delta encoding.",
         "tags": ["brotli", "delta_encoding", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
@@ -1,10 +1,14 @@
 import numpy as np
 import os
+from functools import lru_cache
+from ..ans.delta_encode import delta_encode
+from ..ans.delta_decode import delta_decode
 
 
 SOURCE_FILE = "bzip2/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "bzip2.md")
@@ -12,13 +16,10 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def bzip2_encode(x: np.ndarray, level: int) -> bytes:
     import bz2
 
-    buf = x.tobytes()
+    buf = np.ascontiguousarray(x)
     compressed = bz2.compress(buf, compresslevel=level)
     return compressed
 
@@ -35,9 +36,7 @@ def bzip2_delta_encode(x: np.ndarray, level: int) -> bytes:
     import bz2
 
     assert x.ndim == 1
-    y = np.diff(x)
-    y = np.insert(y, 0, x[0])
-    buf = y.tobytes()
+    buf = delta_encode(x)
     compressed = bz2.compress(buf, compresslevel=level)
     return compressed
 
@@ -49,7 +48,7 @@ def bzip2_delta_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
 
     buf = bz2.decompress(x)
     y = np.frombuffer(buf, dtype=dtype)
-    return np.cumsum(y)
+    return delta_decode(y[1:], y[0])
 
 
 algorithms = [
@@ -61,7 +60,7 @@ algorithms = [
         "description": "Bzip2 compression at level 1 (fastest).",
         "tags": ["bzip2"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bzip2-3",
@@ -71,7 +70,7 @@ algorithms = [
         "description": "Bzip2 compression at level 3.",
         "tags": ["bzip2"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bzip2-5",
@@ -81,7 +80,7 @@ algorithms = [
         "description": "Bzip2 compression at level 5 (medium).",
         "tags": ["bzip2"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bzip2-7",
@@ -91,7 +90,7 @@ algorithms = [
         "description": "Bzip2 compression at level 7.",
         "tags": ["bzip2"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bzip2-9",
@@ -101,7 +100,7 @@ algorithms = [
         "description": "Bzip2 compression at maximum level 9.",
         "tags": ["bzip2"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bzip2-9-delta",
@@ -111,6 +110,6 @@ algorithms = [
         "description": "Bzip2 compression at level 9 with delta encoding.",
         "tags": ["bzip2", "delta_encoding", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
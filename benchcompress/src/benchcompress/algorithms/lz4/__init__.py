@@ -1,10 +1,14 @@
 import numpy as np
 import os
+from functools import lru_cache
+from ..ans.delta_encode import delta_encode
+from ..ans.delta_decode import delta_decode
 
 
 SOURCE_FILE = "lz4/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "lz4.md")
@@ -12,13 +16,10 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def lz4_encode(x: np.ndarray, level: int) -> bytes:
     import lz4.frame
 
-    buf = x.tobytes()
+    buf = np.ascontiguousarray(x)
     compressed = lz4.frame.compress(buf, compression_level=level)
     return compressed
 
@@ -35,9 +36,7 @@ def lz4_delta_encode(x: np.ndarray, level: int) -> bytes:
     import lz4.frame
 
     assert x.ndim == 1
-    y = np.diff(x)
-    y = np.insert(y, 0, x[0])
-    buf = y.tobytes()
+    buf = delta_encode(x)
     compressed = lz4.frame.compress(buf, compression_level=level)
     return compressed
 
@@ -49,7 +48,7 @@ def lz4_delta_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
 
     buf = lz4.frame.decompress(x)
     y = np.frombuffer(buf, dtype=dtype)
-    return np.cumsum(y)
+    return delta_decode(y[1:], y[0])
 
 
 algorithms = [
@@ -61,7 +60,7 @@ algorithms = [
         "description": "LZ4 compression at level 0 (fastest).",
         "tags": ["lz4"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "lz4-3",
@@ -71,7 +70,7 @@ algorithms = [
         "description": "LZ4 compression at level 3 (minimum high compression).",
         "tags": ["lz4"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "lz4-10",
@@ -81,7 +80,7 @@ algorithms = [
         "description": "LZ4 compression at level 10.",
         "tags": ["lz4"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "lz4-16",
@@ -91,7 +90,7 @@ algorithms = [
         "description": "LZ4 compression at level 16 (highest compression).",
         "tags": ["lz4"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "lz4-16-delta",
@@ -101,6 +100,6 @@ algorithms = [
         "description": "LZ4 compression at level 16 with delta encoding.",
         "tags": ["lz4", "delta_encoding", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
@@ -1,10 +1,14 @@
 import numpy as np
 import os
+from functools import lru_cache
+from ..ans.delta_encode import delta_encode
+from ..ans.delta_decode import delta_decode
 
 
 SOURCE_FILE = "lzma/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "lzma.md")
@@ -12,16 +16,11 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def lzma_delta_encode(x: np.ndarray, preset: int) -> bytes:
     import lzma
 
     assert x.ndim == 1
-    y = np.diff(x)
-    y = np.insert(y, 0, x[0])
-    buf = y.tobytes()
+    buf = delta_encode(x)
     compressed = lzma.compress(buf, preset=preset)
     return compressed
 
@@ -33,13 +32,13 @@ def lzma_delta_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
 
     buf = lzma.decompress(x)
     y = np.frombuffer(buf, dtype=dtype)
-    return np.cumsum(y)
+    return delta_decode(y[1:], y[0])
 
 
 def lzma_encode(x: np.ndarray, preset: int) -> bytes:
     import lzma
 
-    buf = x.tobytes()
+    buf = np.ascontiguousarray(x)
     compressed = lzma.compress(buf, preset=preset)
     return compressed
 
@@ -61,7 +60,7 @@ algorithms = [
         "description": "LZMA compression at maximum preset 9 for highest compression ratio.",
         "tags": ["lzma"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "lzma-9-delta",
@@ -71,6 +70,6 @@ algorithms = [
         "description": "LZMA compression at preset 9 with delta encoding for improved compression of sequential data.",
         "tags": ["lzma", "delta_encoding", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
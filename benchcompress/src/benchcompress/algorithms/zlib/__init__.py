@@ -1,10 +1,14 @@
 import numpy as np
 import os
+from functools import lru_cache
+from ..ans.delta_encode import delta_encode
+from ..ans.delta_decode import delta_decode
 
 
 SOURCE_FILE = "zlib/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "zlib.md")
@@ -12,13 +16,10 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def zlib_encode(x: np.ndarray, level: int) -> bytes:
     import zlib
 
-    buf = x.tobytes()
+    buf = np.ascontiguousarray(x)
     compressed = zlib.compress(buf, level=level)
     return compressed
 
@@ -35,9 +36,7 @@ def zlib_delta_encode(x: np.ndarray, level: int) -> bytes:
     import zlib
 
     assert x.ndim == 1
-    y = np.diff(x)
-    y = np.insert(y, 0, x[0])
-    buf = y.tobytes()
+    buf = delta_encode(x)
     compressed = zlib.compress(buf, level=level)
     return compressed
 
@@ -49,7 +48,7 @@ def zlib_delta_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
 
     buf = zlib.decompress(x)
     y = np.frombuffer(buf, dtype=dtype)
-    return np.cumsum(y)
+    return delta_decode(y[1:], y[0])
 
 
 algorithms = [
@@ -61,7 +60,7 @@ algorithms = [
         "description": "Zlib DEFLATE compression at level 1 (fastest).",
         "tags": ["zlib"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zlib-3",
@@ -71,7 +70,7 @@ algorithms = [
         "description": "Zlib DEFLATE compression at level 3.",
         "tags": ["zlib"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zlib-5",
@@ -81,7 +80,7 @@ algorithms = [
         "description": "Zlib DEFLATE compression at level 5 (medium).",
         "tags": ["zlib"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zlib-7",
@@ -91,7 +90,7 @@ algorithms = [
         "description": "Zlib DEFLATE compression at level 7.",
         "tags": ["zlib"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zlib-9",
@@ -101,7 +100,7 @@ algorithms = [
         "description": "Zlib DEFLATE compression at maximum level 9.",
         "tags": ["zlib"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zlib-9-delta",
@@ -111,6 +110,6 @@ algorithms = [
         "description": "Zlib DEFLATE compression at level 9 with delta encoding.",
         "tags": ["zlib", "delta_encoding", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
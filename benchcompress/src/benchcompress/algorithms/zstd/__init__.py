@@ -1,13 +1,25 @@
 import numpy as np
 import os
+import struct
+import threading
+import zstandard as zstd
+from functools import lru_cache
 from ..ans.markov_reconstruct import markov_reconstruct as markov_reconstruct_cpp
 from ..ans.markov_predict import markov_predict as markov_predict_cpp
-from ..ans.get_run_lengths import get_run_lengths
+from ..ans.get_run_lengths import (
+    get_run_lengths,
+    get_non_zero_mask,
+    RUN_LENGTH_DTYPE_TO_CODE,
+    CODE_TO_RUN_LENGTH_DTYPE,
+)
+from ..ans.delta_encode import delta_encode
+from ..ans.delta_decode import delta_decode
 
 
 SOURCE_FILE = "zstd/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "zstd.md")
@@ -15,94 +27,194 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
+# Frame size and dictionary size for the dictionary variants
+_DICT_CHUNK_NBYTES = 65536
+_DICT_SIZE = 16384
+# dictionary size, number of frames
+_DICT_HEADER_FORMAT = "<QQ"
 
+# Job size for multi-threaded compression. libzstd's default job size grows with
+# the window size (64 MiB and up at high levels), so a few-MB input would be
+# compressed as a single job on one thread. 512 KiB is the smallest job size
+# libzstd accepts (ZSTDMT_JOBSIZE_MIN); smaller values are raised to it.
+_MT_JOB_SIZE = 512 * 1024
+_MT_OVERLAP_LOG = 6
 
-def zstd_delta_encode(x: np.ndarray, level: int) -> bytes:
-    import zstandard as zstd
+# zstd-N and zstd-N-delta streams start with the array dtype (numpy dtype string,
+# e.g. "<i2", NUL-padded) followed by the zstd frame
+_DTYPE_TAG_NBYTES = 8
 
+
+# Compression contexts are not safe to share between threads, so each thread
+# keeps its own cache
+_local = threading.local()
+
+
+def _get_cctx(level: int, threads: int = 0):
+    """Return a reusable compressor for the given level.
+
+    threads=0 compresses on the calling thread; a negative value uses one
+    libzstd worker per logical CPU, splitting the input into _MT_JOB_SIZE jobs.
+    """
+    compressors = getattr(_local, "compressors", None)
+    if compressors is None:
+        compressors = _local.compressors = {}
+    compressor = compressors.get((level, threads))
+    if compressor is None:
+        if threads == 0:
+            compressor = zstd.ZstdCompressor(level=level)
+        else:
+            params = zstd.ZstdCompressionParameters.from_level(
+                level,
+                threads=threads,
+                job_size=_MT_JOB_SIZE,
+                overlap_log=_MT_OVERLAP_LOG,
+            )
+            compressor = zstd.ZstdCompressor(compression_params=params)
+        compressors[(level, threads)] = compressor
+    return compressor
+
+
+def _get_dctx():
+    """Return a reusable decompressor."""
+    decompressor = getattr(_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _local.decompressor = zstd.ZstdDecompressor()
+    return decompressor
+
+
+def _dtype_tag(dtype) -> bytes:
+    return np.dtype(dtype).str.encode("ascii").ljust(_DTYPE_TAG_NBYTES, b"\0")
+
+
+@lru_cache(maxsize=None)
+def _parse_dtype_tag(tag: bytes) -> np.dtype:
+    return np.dtype(tag.rstrip(b"\0").decode("ascii"))
+
+
+def _split_dtype_tag(x: bytes, dtype: str):
+    """Return the stored dtype and the zstd frame of a tagged stream."""
+    buf = memoryview(x)
+    stored_dtype = _parse_dtype_tag(bytes(buf[:_DTYPE_TAG_NBYTES]))
+    assert stored_dtype == np.dtype(dtype)
+    return stored_dtype, buf[_DTYPE_TAG_NBYTES:]
+
+
+def zstd_delta_encode(x: np.ndarray, level: int, threads: int = 0) -> bytes:
     assert x.ndim == 1
 
-    y = np.diff(x)
-    y = np.insert(y, 0, x[0])
-    buf = y.tobytes()
-    compressor = zstd.ZstdCompressor(level=level)
-    compressed = compressor.compress(buf)
-    return compressed
+    # python-zstandard reads the array buffer directly, so no bytes copy is needed
+    y = delta_encode(x)
+    compressor = _get_cctx(level, threads)
+    compressed = compressor.compress(y)
+    return _dtype_tag(x.dtype) + compressed
 
 
 def zstd_delta_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
-    import zstandard as zstd
-
     assert len(shape) == 1
 
-    decompressor = zstd.ZstdDecompressor()
-    buf = decompressor.decompress(x)
-    y = np.frombuffer(buf, dtype=dtype)
-    return np.cumsum(y)
-
+    stored_dtype, frame = _split_dtype_tag(x, dtype)
+    decompressor = _get_dctx()
+    buf = decompressor.decompress(frame)
+    y = np.frombuffer(buf, dtype=stored_dtype)
+    return delta_decode(y[1:], y[0])
 
-def zstd_encode(x: np.ndarray, level: int) -> bytes:
-    import zstandard as zstd
 
-    buf = x.tobytes()
-    compressor = zstd.ZstdCompressor(level=level)
+def zstd_encode(x: np.ndarray, level: int, threads: int = 0) -> bytes:
+    # python-zstandard reads the array buffer directly (it must be C-contiguous)
+    buf = np.ascontiguousarray(x)
+    compressor = _get_cctx(level, threads)
     compressed = compressor.compress(buf)
-    return compressed
+    return _dtype_tag(x.dtype) + compressed
 
 
 def zstd_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
-    import zstandard as zstd
+    stored_dtype, frame = _split_dtype_tag(x, dtype)
+    decompressor = _get_dctx()
+    buf = decompressor.decompress(frame)
+    y = np.frombuffer(buf, dtype=stored_dtype)
+    return y.reshape(shape)
+
+
+def zstd_dict_encode(x: np.ndarray, level: int) -> bytes:
+    buf = x.tobytes()
 
-    decompressor = zstd.ZstdDecompressor()
-    buf = decompressor.decompress(x)
-    y = np.frombuffer(buf, dtype=dtype)
+    # Split into independently decodable frames sharing one trained dictionary
+    chunks = [
+        buf[i : i + _DICT_CHUNK_NBYTES] for i in range(0, len(buf), _DICT_CHUNK_NBYTES)
+    ]
+    try:
+        dict_data = zstd.train_dictionary(_DICT_SIZE, chunks)
+        dict_bytes = dict_data.as_bytes()
+        compressor = zstd.ZstdCompressor(level=level, dict_data=dict_data)
+    except zstd.ZstdError:
+        # Training fails when there is too little (or too random) data
+        dict_bytes = b""
+        compressor = _get_cctx(level)
+    frames = [compressor.compress(chunk) for chunk in chunks]
+    frame_sizes = np.array([len(frame) for frame in frames], dtype=np.uint32)
+
+    header = struct.pack(_DICT_HEADER_FORMAT, len(dict_bytes), len(frames))
+    return b"".join([header, dict_bytes, memoryview(frame_sizes)] + frames)
+
+
+def zstd_dict_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
+    buf = memoryview(x)
+
+    dict_size, num_frames = struct.unpack_from(_DICT_HEADER_FORMAT, buf)
+    pos = struct.calcsize(_DICT_HEADER_FORMAT)
+    if dict_size > 0:
+        dict_data = zstd.ZstdCompressionDict(bytes(buf[pos : pos + dict_size]))
+        decompressor = zstd.ZstdDecompressor(dict_data=dict_data)
+    else:
+        decompressor = _get_dctx()
+    pos += dict_size
+    frame_sizes = np.frombuffer(buf, dtype=np.uint32, count=num_frames, offset=pos)
+    pos += frame_sizes.nbytes
+
+    chunks = []
+    for frame_size in frame_sizes:
+        chunks.append(decompressor.decompress(buf[pos : pos + frame_size]))
+        pos += int(frame_size)
+    y = np.frombuffer(b"".join(chunks), dtype=dtype)
     return y.reshape(shape)
 
 
 def zstd_markov_encode(x: np.ndarray, level: int) -> bytes:
-    import zstandard as zstd
-    import struct
-
     assert x.ndim == 1
     coeffs, initial, resid = markov_predict_cpp(x, M=6, num_training_samples=10000)
 
-    # Convert coeffs and initial to bytes
-    coeffs_bytes = coeffs.tobytes()
-    initial_bytes = initial.tobytes()
-
     # Create header with lengths
-    header = struct.pack("QQ", len(coeffs_bytes), len(initial_bytes))
+    header = struct.pack("QQ", coeffs.nbytes, initial.nbytes)
 
     # Compress residuals
-    resid_bytes = resid.tobytes()
-    compressor = zstd.ZstdCompressor(level=level)
-    compressed_resid = compressor.compress(resid_bytes)
+    compressor = _get_cctx(level)
+    compressed_resid = compressor.compress(np.ascontiguousarray(resid))
 
-    # Combine all parts
-    return header + coeffs_bytes + initial_bytes + compressed_resid
+    # Combine all parts in a single copy
+    return b"".join([header, memoryview(coeffs), memoryview(initial), compressed_resid])
 
 
 def zstd_markov_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
-    import zstandard as zstd
-    import struct
-
     assert len(shape) == 1
 
+    # Slice through a memoryview so that the sections are not copied
+    buf = memoryview(x)
+
     # Extract header
     header_size = struct.calcsize("QQ")
-    coeffs_len, initial_len = struct.unpack("QQ", x[:header_size])
+    coeffs_len, initial_len = struct.unpack_from("QQ", buf)
 
     # Extract coefficients and initial values
     pos = header_size
-    coeffs = np.frombuffer(x[pos : pos + coeffs_len], dtype=np.float32)
+    coeffs = np.frombuffer(buf[pos : pos + coeffs_len], dtype=np.float32)
     pos += coeffs_len
-    initial = np.frombuffer(x[pos : pos + initial_len], dtype=dtype)
+    initial = np.frombuffer(buf[pos : pos + initial_len], dtype=dtype)
     pos += initial_len
 
     # Decompress residuals
-    decompressor = zstd.ZstdDecompressor()
-    resid_buf = decompressor.decompress(x[pos:])
+    decompressor = _get_dctx()
+    resid_buf = decompressor.decompress(buf[pos:])
     resid = np.frombuffer(resid_buf, dtype=dtype)
 
     # Reconstruct signal
@@ -111,207 +223,236 @@ def zstd_markov_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
 
 
 def zstd_markov_zrle_encode(x: np.ndarray, level: int) -> bytes:
-    import zstandard as zstd
-    import struct
-
     assert x.ndim == 1
 
     # Get run lengths for zero/non-zero sequences
     run_lengths = get_run_lengths(x)
 
     # Determine run length dtype code
-    if run_lengths.dtype == np.uint8:
-        run_length_dtype_code = 0
-    elif run_lengths.dtype == np.uint16:
-        run_length_dtype_code = 1
-    elif run_lengths.dtype == np.uint32:
-        run_length_dtype_code = 2
-    else:
+    run_length_dtype_code = RUN_LENGTH_DTYPE_TO_CODE.get(run_lengths.dtype)
+    if run_length_dtype_code is None:
         raise ValueError(f"Unsupported run length dtype: {run_lengths.dtype}")
 
     # Extract non-zero data
-    non_zero_arrays = []
-    array_pos = 0
-    i = 0
-    while i < len(run_lengths):
-        non_zero_len = int(run_lengths[i])
-        if non_zero_len > 0:
-            non_zero_arrays.append(x[array_pos : array_pos + non_zero_len])
-            array_pos += non_zero_len
-        i += 1
-        if i < len(run_lengths):
-            array_pos += int(run_lengths[i])  # Skip zeros
-            i += 1
-
-    non_zero_data = np.concatenate(non_zero_arrays)
+    non_zero_data = x[get_non_zero_mask(run_lengths)]
 
     # Apply Markov prediction on non-zero data
     coeffs, initial, resid = markov_predict_cpp(
         non_zero_data, M=6, num_training_samples=10000
     )
 
-    # Convert data to bytes
-    coeffs_bytes = coeffs.tobytes()
-    initial_bytes = initial.tobytes()
-    run_lengths_bytes = run_lengths.tobytes()
-
     # Create header with lengths and dtype code
     header = struct.pack(
         "QQQQB",
-        len(coeffs_bytes),
-        len(initial_bytes),
-        len(run_lengths_bytes),
+        coeffs.nbytes,
+        initial.nbytes,
+        run_lengths.nbytes,
         len(run_lengths),
         run_length_dtype_code,
     )
 
     # Compress residuals
-    resid_bytes = resid.tobytes()
-    compressor = zstd.ZstdCompressor(level=level)
-    compressed_resid = compressor.compress(resid_bytes)
-
-    # Combine all parts
-    return header + coeffs_bytes + initial_bytes + run_lengths_bytes + compressed_resid
+    compressor = _get_cctx(level)
+    compressed_resid = compressor.compress(np.ascontiguousarray(resid))
+
+    # Combine all parts in a single copy
+    return b"".join(
+        [
+            header,
+            memoryview(coeffs),
+            memoryview(initial),
+            memoryview(run_lengths),
+            compressed_resid,
+        ]
+    )
 
 
 def zstd_markov_zrle_decode(x: bytes, dtype: str, shape: tuple) -> np.ndarray:
-    import zstandard as zstd
-    import struct
-
     assert len(shape) == 1
 
+    # Slice through a memoryview so that the sections are not copied
+    buf = memoryview(x)
+
     # Extract header
     header_size = struct.calcsize("QQQQB")
     coeffs_len, initial_len, run_lengths_len, num_run_lengths, run_length_dtype_code = (
-        struct.unpack("QQQQB", x[:header_size])
+        struct.unpack_from("QQQQB", buf)
     )
 
     # Extract components
     pos = header_size
-    coeffs = np.frombuffer(x[pos : pos + coeffs_len], dtype=np.float32)
+    coeffs = np.frombuffer(buf[pos : pos + coeffs_len], dtype=np.float32)
     pos += coeffs_len
-    initial = np.frombuffer(x[pos : pos + initial_len], dtype=dtype)
+    initial = np.frombuffer(buf[pos : pos + initial_len], dtype=dtype)
     pos += initial_len
 
     # Get run lengths with proper dtype
-    if run_length_dtype_code == 0:
-        run_lengths = np.frombuffer(x[pos : pos + run_lengths_len], dtype=np.uint8)
-    elif run_length_dtype_code == 1:
-        run_lengths = np.frombuffer(x[pos : pos + run_lengths_len], dtype=np.uint16)
-    elif run_length_dtype_code == 2:
-        run_lengths = np.frombuffer(x[pos : pos + run_lengths_len], dtype=np.uint32)
-    else:
+    run_length_dtype = CODE_TO_RUN_LENGTH_DTYPE.get(run_length_dtype_code)
+    if run_length_dtype is None:
         raise ValueError(f"Unsupported run length dtype code: {run_length_dtype_code}")
+    run_lengths = np.frombuffer(
+        buf[pos : pos + run_lengths_len], dtype=run_length_dtype
+    )
     pos += run_lengths_len
 
     assert len(run_lengths) == num_run_lengths
 
     # Decompress residuals
-    decompressor = zstd.ZstdDecompressor()
-    resid_buf = decompressor.decompress(x[pos:])
+    decompressor = _get_dctx()
+    resid_buf = decompressor.decompress(buf[pos:])
     resid = np.frombuffer(resid_buf, dtype=dtype)
 
     # Reconstruct non-zero data
     non_zero_data = markov_reconstruct_cpp(coeffs, initial, resid)
 
     # Reconstruct full array using run lengths
-    non_zero_pos = 0
-    i = 0
-    segments = []
-    while i < len(run_lengths):
-        non_zero_len = int(run_lengths[i])
-        if non_zero_len > 0:
-            segment = non_zero_data[non_zero_pos : non_zero_pos + non_zero_len]
-            segments.append(segment)
-            non_zero_pos += non_zero_len
-        i += 1
-        if i < len(run_lengths):
-            segments.append(np.zeros(int(run_lengths[i]), dtype=non_zero_data.dtype))
-            i += 1
-
-    return np.concatenate(segments)
+    non_zero_mask = get_non_zero_mask(run_lengths)
+    output = np.zeros(len(non_zero_mask), dtype=non_zero_data.dtype)
+    output[non_zero_mask] = non_zero_data
+
+    return output
 
 
 algorithms = [
     {
         "name": "zstd-4",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=4),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at level 4 (fast compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-7",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=7),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at level 7 (balanced speed/compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-10",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=10),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at level 10 (better compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-13",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=13),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at level 13 (high compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-16",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=16),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at level 16 (very high compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-19",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=19),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at level 19 (ultra high compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-22",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_encode(x, level=22),
         "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
         "description": "Zstandard compression at maximum level 22 (highest compression).",
         "tags": ["zstd"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "zstd-13-mt",
+        "version": "2",
+        "encode": lambda x: zstd_encode(x, level=13, threads=-1),
+        "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
+        "description": "Zstandard compression at level 13 using all CPU cores.",
+        "tags": ["zstd", "multithreaded"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "zstd-19-mt",
+        "version": "3",
+        "encode": lambda x: zstd_encode(x, level=19, threads=-1),
+        "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
+        "description": "Zstandard compression at level 19 using all CPU cores.",
+        "tags": ["zstd", "multithreaded"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "zstd-22-mt",
+        "version": "3",
+        "encode": lambda x: zstd_encode(x, level=22, threads=-1),
+        "decode": lambda x, dtype, shape: zstd_decode(x, dtype, shape),
+        "description": "Zstandard compression at maximum level 22 using all CPU cores.",
+        "tags": ["zstd", "multithreaded"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "zstd-7-dict",
+        "version": "2",
+        "encode": lambda x: zstd_dict_encode(x, level=7),
+        "decode": lambda x, dtype, shape: zstd_dict_decode(x, dtype, shape),
+        "description": "Zstandard compression at level 7 of 64 KiB frames sharing a trained dictionary.",
+        "tags": ["zstd", "dictionary"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "zstd-22-dict",
+        "version": "2",
+        "encode": lambda x: zstd_dict_encode(x, level=22),
+        "decode": lambda x, dtype, shape: zstd_dict_decode(x, dtype, shape),
+        "description": "Zstandard compression at level 22 of 64 KiB frames sharing a trained dictionary.",
+        "tags": ["zstd", "dictionary"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-22-delta",
-        "version": "1",
+        "version": "2",
         "encode": lambda x: zstd_delta_encode(x, level=22),
         "decode": lambda x, dtype, shape: zstd_delta_decode(x, dtype, shape),
         "description": "Zstandard compression at level 22 with delta encoding for improved compression of sequential data.",
         "tags": ["zstd", "delta_encoding", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
+    },
+    {
+        "name": "zstd-22-delta-mt",
+        "version": "2",
+        "encode": lambda x: zstd_delta_encode(x, level=22, threads=-1),
+        "decode": lambda x, dtype, shape: zstd_delta_decode(x, dtype, shape),
+        "description": "Zstandard compression at level 22 with delta encoding using all CPU cores.",
+        "tags": ["zstd", "delta_encoding", "1d", "multithreaded"],
+        "source_file": SOURCE_FILE,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-22-markov",
@@ -321,7 +462,7 @@ algorithms = [
         "description": "Zstandard compression at level 22 with Markov prediction for exploiting temporal correlations in the data.",
         "tags": ["zstd", "markov_prediction", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "zstd-22-markov-zrle",
@@ -331,6 +472,6 @@ algorithms = [
         "description": "Zstandard compression at level 22 with Markov prediction and zero run-length encoding for sparse data.",
         "tags": ["zstd", "markov_prediction", "zero_rle", "1d"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
@@ -1,10 +1,12 @@
 import numpy as np
 import os
+from functools import lru_cache
 
 
 SOURCE_FILE = "bernoulli/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "bernoulli.md")
@@ -12,9 +14,6 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def create_bernoulli(*, n_samples: int, p: float, seed: int) -> np.ndarray:
     rng = np.random.default_rng(seed)
     x = rng.binomial(1, p, n_samples).astype(np.uint8)
@@ -31,7 +30,7 @@ datasets = [
         "description": "Binary sequence with 10% probability of ones.",
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bernoulli-0.2",
@@ -40,7 +39,7 @@ datasets = [
         "description": "Binary sequence with 20% probability of ones.",
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bernoulli-0.3",
@@ -49,7 +48,7 @@ datasets = [
         "description": "Binary sequence with 30% probability of ones.",
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bernoulli-0.4",
@@ -58,7 +57,7 @@ datasets = [
         "description": "Binary sequence with 40% probability of ones.",
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "bernoulli-0.5",
@@ -67,6 +66,6 @@ datasets = [
         "description": "Binary sequence with 50% probability of ones and 50% probability of zeros.",
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
@@ -1,6 +1,6 @@
 import numpy as np
-import lindi
 import os
+from functools import lru_cache
 from typing import cast
 from ..._filters import bandpass_filter
 from ..._analysis import estimate_noise_level
@@ -9,6 +9,7 @@ from ..._analysis import estimate_noise_level
 SOURCE_FILE = "ecephys/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "ecephys.md")
@@ -16,8 +17,6 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
 tags = ["real", "ecephys", "timeseries", "1d", "integer", "continuous"]
 
 
@@ -35,6 +34,8 @@ def _load_real_000876(
         Array of shape (num_samples, num_channels) containing the loaded data
     """
     nwb_url = "https://api.dandiarchive.org/api/assets/7e1de06d-d478-40e2-9b64-9dd04eafaa4c/download/"
+    import lindi
+
     h5f = lindi.LindiH5pyFile.from_hdf5_file(nwb_url)
     ds = h5f["/acquisition/ElectricalSeriesAP/data"]
     assert isinstance(ds, lindi.LindiH5pyDataset)
@@ -56,6 +57,8 @@ def _load_real_000409(
         Array of shape (num_samples, num_channels) containing the loaded data
     """
     nwb_url = "https://api.dandiarchive.org/api/assets/c04f6b30-82bf-40e1-9210-34f0bcd8be24/download/"
+    import lindi
+
     h5f = lindi.LindiH5pyFile.from_hdf5_file(nwb_url)
     ds = h5f["/acquisition/ElectricalSeriesAp/data"]
     assert isinstance(ds, lindi.LindiH5pyDataset)
@@ -77,6 +80,8 @@ def _load_real_001290(
         Array of shape (num_samples, num_channels) containing the loaded data
     """
     nwb_url = "https://api.dandiarchive.org/api/assets/78c99d23-da88-4ecd-9086-c488a126eac5/download/"
+    import lindi
+
     h5f = lindi.LindiH5pyFile.from_hdf5_file(nwb_url)
     ds = h5f["/acquisition/ElectricalSeriesAPImec/data"]
     assert isinstance(ds, lindi.LindiH5pyDataset)
@@ -210,7 +215,7 @@ datasets = [
         ).flatten(),
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ecephys-000409-ch101",
@@ -221,7 +226,7 @@ datasets = [
         ).flatten(),
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ecephys-001290-ch0",
@@ -232,7 +237,7 @@ datasets = [
         ).flatten(),
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     # embargoed
     # {
@@ -242,7 +247,7 @@ datasets = [
     #     "create": lambda: _load_real_001259(num_samples=500_000).flatten(),
     #     "tags": tags,
     #     "source_file": SOURCE_FILE,
-    #     "long_description": LONG_DESCRIPTION,
+    #     "long_description": _load_long_description,
     # },
     {
         "name": "ecephys-000876-ch45-filtered",
@@ -255,7 +260,7 @@ datasets = [
         ),
         "tags": tags + ["filtered"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ecephys-000409-ch101-filtered",
@@ -268,7 +273,7 @@ datasets = [
         ),
         "tags": tags + ["filtered"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ecephys-001290-ch0-filtered",
@@ -281,7 +286,7 @@ datasets = [
         ),
         "tags": tags + ["filtered"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     # embargoed
     # {
@@ -293,7 +298,7 @@ datasets = [
     #     ),
     #     "tags": tags + ["filtered"],
     #     "source_file": SOURCE_FILE,
-    #     "long_description": LONG_DESCRIPTION,
+    #     "long_description": _load_long_description,
     # },
     {
         "name": "ecephys-000876-ch45-sparse",
@@ -306,7 +311,7 @@ datasets = [
         ),
         "tags": tags + ["filtered", "sparse"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ecephys-000409-ch101-sparse",
@@ -319,7 +324,7 @@ datasets = [
         ),
         "tags": tags + ["filtered", "sparse"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ecephys-001290-ch0-sparse",
@@ -332,7 +337,7 @@ datasets = [
         ),
         "tags": tags + ["filtered", "sparse"],
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     # embargoed
     # {
@@ -344,6 +349,6 @@ datasets = [
     #     ),
     #     "tags": tags + ["filtered", "sparse"],
     #     "source_file": SOURCE_FILE,
-    #     "long_description": LONG_DESCRIPTION,
+    #     "long_description": _load_long_description,
     # },
 ]
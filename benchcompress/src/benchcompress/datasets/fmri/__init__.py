@@ -1,11 +1,12 @@
 import numpy as np
 import os
-import nibabel as nib
+from functools import lru_cache
 from typing import cast, Optional, List
 
 SOURCE_FILE = "fmri/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "fmri.md")
@@ -13,8 +14,6 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
 tags = ["real", "fmri", "timeseries", "1d", "integer", "bold", "continuous"]
 
 
@@ -32,6 +31,7 @@ def _load_bold_data(*, slice_indices: Optional[List[int]] = None) -> np.ndarray:
     url = "https://s3.amazonaws.com/openneuro.org/ds005880/sub-01/func/sub-01_task-rest_run-01_bold.nii.gz?versionId=0z5_YvqoLC4pXDVUVDt9Y1nrJBRxMqXb"
     # Download and load the data
     import requests
+    import nibabel as nib
     from pathlib import Path
 
     cache_dir = Path(os.path.expanduser("~/.cache/benchcompress/fmri"))
@@ -66,6 +66,6 @@ datasets = [
         "create": lambda: _load_bold_data(slice_indices=list(range(15, 30))),
         "tags": tags,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     }
 ]
@@ -1,10 +1,12 @@
 import numpy as np
 import os
+from functools import lru_cache
 
 
 SOURCE_FILE = "gaussian/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "gaussian.md")
@@ -12,15 +14,13 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
-
 def create_gaussian_quantized(
     *, n_samples: int, stddev: float, seed: int
 ) -> np.ndarray:
     rng = np.random.default_rng(seed)
-    x = np.round(rng.normal(0, stddev, n_samples)).astype(np.int16)
-    return x
+    x = rng.normal(0, stddev, n_samples)
+    np.rint(x, out=x)  # round in place rather than allocating another array
+    return x.astype(np.int16)
 
 
 def create_gaussian_float(*, n_samples: int, stddev: float, seed: int) -> np.ndarray:
@@ -50,7 +50,7 @@ datasets = [
         "description": "Rounded Gaussian integers with σ=1.",
         "tags": tags_quantized,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "gaussian-q2",
@@ -61,7 +61,7 @@ datasets = [
         "description": "Rounded Gaussian integers with σ=2.",
         "tags": tags_quantized,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "gaussian-q3",
@@ -72,7 +72,7 @@ datasets = [
         "description": "Rounded Gaussian integers with σ=3.",
         "tags": tags_quantized,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "gaussian-q5",
@@ -83,7 +83,7 @@ datasets = [
         "description": "Rounded Gaussian integers with σ=5.",
         "tags": tags_quantized,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "gaussian-q8",
@@ -94,7 +94,7 @@ datasets = [
         "description": "Rounded Gaussian integers with σ=8.",
         "tags": tags_quantized,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "gaussian-flt1",
@@ -103,6 +103,6 @@ datasets = [
         "description": "Floating point Gaussian numbers with σ=1.",
         "tags": tags_float,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
@@ -1,11 +1,12 @@
 import numpy as np
 import os
-import requests
+from functools import lru_cache
 import pyedflib
 
 SOURCE_FILE = "ieeg/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "ieeg.md")
@@ -13,8 +14,6 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
 tags = ["real", "ecephys", "ieeg", "timeseries", "1d", "continuous"]
 tags_float = tags + ["float"]
 tags_integer = tags + ["integer"]
@@ -31,6 +30,8 @@ def _load_ieeg_openneuro_005592() -> np.ndarray:
 
     # Download if needed
     if not os.path.exists(edf_filename):
+        import requests
+
         print(f"Downloading {edf_filename}...")
         response = requests.get(url)
         with open(edf_filename, "wb") as f:
@@ -71,7 +72,7 @@ datasets = [
         "create": lambda: _load_ieeg_openneuro_005592(),
         "tags": tags_float,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "ieeg-005592-quantized",
@@ -80,6 +81,6 @@ datasets = [
         "create": lambda: _load_quantized_ieeg_openneuro_005592(),
         "tags": tags_integer,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
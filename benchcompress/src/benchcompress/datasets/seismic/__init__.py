@@ -1,12 +1,14 @@
 import numpy as np
 import segyio
 import os
-import requests
+from functools import lru_cache
+import shutil
 
 
 SOURCE_FILE = "seismic/__init__.py"
 
 
+@lru_cache(maxsize=None)
 def _load_long_description():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     md_path = os.path.join(current_dir, "seismic.md")
@@ -14,8 +16,6 @@ def _load_long_description():
         return f.read()
 
 
-LONG_DESCRIPTION = _load_long_description()
-
 tags = ["real", "seismic", "continuous", "timeseries", "1d"]
 tags_float = tags + ["float"]
 tags_integer = tags + ["integer"]
@@ -29,31 +29,33 @@ def _load_04A_04B_seismic_data() -> np.ndarray:
     """
     file_path = "04A+04B.segy"
     if not os.path.exists(file_path):
+        import requests
+
         # Download the SEG-Y file
         url = "https://zenodo.org/records/8152964/files/04A+04B.segy?download=1"
-        response = requests.get(url)
-        with open(file_path, "wb") as f:
-            f.write(response.content)
+        # Stream to a temporary file so that the whole file is never held in memory
+        # and an interrupted download is not mistaken for a complete one
+        tmp_path = file_path + ".download"
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
+        os.replace(tmp_path, file_path)
         print(f"Downloaded {file_path}")
     else:
         print(f"{file_path} already exists locally.")
 
-    # Open the SEG-Y file
-    with segyio.open(file_path, "r", ignore_geometry=True) as f:
-        # Read the seismic data
-        data = f.trace.raw[:]
-
-    # Consider only the first 3000 traces, because the others have a bunch of zeros
-    X = data[:3000]
+    # Consider only the first 3000 traces, because the others have a bunch of zeros.
     # The first part of each trace is zeros
-    first_nonzero_indices = []
-    for j in range(X.shape[0]):
-        inds = np.where(X[j] != 0)[0]
-        first_nonzero_indices.append(inds[0] if len(inds) > 0 else -1)
-    # plt.figure(figsize=(10, 5))
-    # plt.hist(first_nonzero_indices, bins=20)
-    # print(np.max(first_nonzero_indices)) # 1607
-    X = X[:, 1700:]
+    # (max over traces of (X != 0).argmax(axis=1) is 1607), so skip 1700 samples.
+    # Read trace by trace into the output so the full cube is never materialized.
+    with segyio.open(file_path, "r", ignore_geometry=True) as f:
+        num_traces = min(3000, f.tracecount)
+        num_samples = len(f.samples)
+        X = np.empty((num_traces, num_samples - 1700), dtype=np.float32)
+        for j in range(num_traces):
+            X[j] = f.trace.raw[j][1700:]
 
     return X.ravel()
 
@@ -73,7 +75,7 @@ datasets = [
         "create": lambda: _load_04A_04B_seismic_data(),
         "tags": tags_float,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
     {
         "name": "seismic-04A-04B-quantized",
@@ -82,6 +84,6 @@ datasets = [
         "create": lambda: _load_quantized_04A_04B_seismic_data(),
         "tags": tags_integer,
         "source_file": SOURCE_FILE,
-        "long_description": LONG_DESCRIPTION,
+        "long_description": _load_long_description,
     },
 ]
@@ -1,5 +1,4 @@
 import json
-import requests
 from typing import Optional
 
 
@@ -21,6 +20,8 @@ def create_signed_upload_url(
         ValueError: If the URL prefix is invalid
         requests.RequestException: If the API request fails
     """
+    import requests
+
     prefix = "https://tempory.net/f/memobin/"
     if not url.startswith(prefix):
         raise ValueError("Invalid url. Does not have proper prefix")
@@ -114,6 +115,8 @@ def upload_to_memobin(
     Raises:
         requests.RequestException: If the upload fails
     """
+    import requests
+
     if isinstance(data, dict):
         data_bytes = json.dumps(data).encode("utf-8")
     else:
@@ -139,6 +142,8 @@ def exists_in_memobin(url: str) -> bool:
     Returns:
         True if the file exists, False otherwise
     """
+    import requests
+
     try:
         response = requests.head(url)
         return (
@@ -161,6 +166,8 @@ def download_from_memobin(url: str, as_json: bool = True) -> Optional[dict | byt
     Raises:
         requests.RequestException: If the download fails for a reason other than 404
     """
+    import requests
+
     response = None
     try:
         response = requests.get(url)
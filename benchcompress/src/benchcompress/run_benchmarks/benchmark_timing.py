@@ -1,18 +1,17 @@
 from typing import Any, Tuple, Callable, Dict
+from functools import partial
 from statistics import median
 import time
 import numpy as np
 
 
-def run_timed_trials(
-    data: np.ndarray, operation: Callable, *args
-) -> Tuple[float, float, Any]:
+def run_timed_trials(data: np.ndarray, operation: Callable) -> Tuple[float, float, Any]:
     """Run multiple trials of an operation until total time exceeds 1 second.
 
     Args:
         data: Input numpy array for calculating throughput
-        operation: Function to benchmark
-        *args: Arguments to pass to the operation
+        operation: Function to benchmark, taking no arguments
+            (bind any arguments with functools.partial)
 
     Returns:
         Tuple containing:
@@ -20,19 +19,21 @@ def run_timed_trials(
         - mb_per_sec: Throughput in MB/s
         - result: Result from the last trial execution
     """
-    times = []
-    total_time = 0
+    # Integer nanoseconds avoid float rounding in the accumulated total
+    times_ns = []
+    total_ns = 0
     array_size_mb = data.nbytes / (1024 * 1024)  # Convert to MB
+    perf_counter_ns = time.perf_counter_ns  # Local binding keeps the timed loop lean
 
     ret = None
-    while total_time < 1.0:
-        start_time = time.perf_counter()
-        ret = operation(*args)  # Execute operation
-        trial_time = time.perf_counter() - start_time
-        times.append(trial_time)
-        total_time += trial_time
-
-    median_time = median(times)
+    while total_ns < 1_000_000_000:
+        start_ns = perf_counter_ns()
+        ret = operation()  # Execute operation
+        trial_ns = perf_counter_ns() - start_ns
+        times_ns.append(trial_ns)
+        total_ns += trial_ns
+
+    median_time = median(times_ns) / 1e9
     mb_per_sec = array_size_mb / median_time
     return median_time, mb_per_sec, ret
 
@@ -58,12 +59,14 @@ def run_compression_benchmark(
         - result: Dictionary with benchmark metrics
         - encoded: Compressed data bytes
     """
-    original_size = len(data.tobytes())
+    original_size = data.nbytes
     dtype = str(data.dtype)
 
     if verbose:
         print("  Encoding...")
-    encode_time, encode_mb_per_sec, encoded = run_timed_trials(data, encode_fn, data)
+    encode_time, encode_mb_per_sec, encoded = run_timed_trials(
+        data, partial(encode_fn, data)
+    )
     compressed_size = len(encoded)
     compression_ratio = original_size / compressed_size
 
@@ -76,7 +79,7 @@ def run_compression_benchmark(
         print("  Decoding...")
 
     decode_time, decode_mb_per_sec, decoded = run_timed_trials(
-        data, decode_fn, encoded, dtype, data.shape
+        data, partial(decode_fn, encoded, dtype, data.shape)
     )
 
     if verbose:
@@ -92,10 +95,11 @@ def run_compression_benchmark(
     if not np.array_equal(data, decoded):
         print(data[:100])
         print(decoded[:100])
-        for j in range(len(data)):
-            if data[j] != decoded[j]:
-                print(f"Error at index {j}: {data[j]} != {decoded[j]}")
-                break
+        mismatch = np.asarray(data != decoded)
+        if mismatch.any():
+            # Locate the first mismatch in C rather than looping in Python
+            j = int(np.argmax(mismatch))
+            print(f"Error at index {j}: {data[j]} != {decoded[j]}")
         raise ValueError(f"Decompression verification failed for {algorithm_name}")
 
     if verbose:
@@ -1,11 +1,28 @@
 import os
 import json
-from typing import Optional, Dict, Any
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set
+import numpy as np
 from ._memobin import (
     construct_memobin_url,
     download_from_memobin,
 )
 
+# orjson is much faster than the json module when indenting, but is optional
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
 
 def check_cached_result(
     cache_dir: str,
@@ -16,6 +33,7 @@ def check_cached_result(
     system_version: str,
     force: bool = False,
     verbose: bool = True,
+    check_remote: bool = True,
 ) -> Optional[Dict[str, Any]]:
     """Check for cached benchmark results locally and in memobin.
 
@@ -28,48 +46,38 @@ def check_cached_result(
         system_version: Version of the system
         force: If True, ignore cached results
         verbose: Whether to print progress messages
+        check_remote: If False, only the local cache is checked (e.g. because
+            memobin was already queried by prefetch_cached_results)
 
     Returns:
         Cached result dictionary if found and valid, None otherwise
     """
-    test_dir = os.path.join(cache_dir, dataset_name, algorithm_name)
-    metadata_file = os.path.join(test_dir, "metadata.json")
-
     # First try local cache (unless force flag is set)
     cached_data = None
-    if not force and os.path.exists(metadata_file):
-        with open(metadata_file, "r") as f:
-            cached_data = json.load(f)
-            # if versions do not match, then set to None
-            if isinstance(cached_data, dict) and "result" in cached_data:
-                result = cached_data["result"]
-                if (
-                    result["algorithm_version"] != algorithm_version
-                    or result["dataset_version"] != dataset_version
-                    or result.get("system_version", "") != system_version
-                ):
-                    cached_data = None
-
-    # If not in local cache, try memobin (unless force flag is set)
-    if cached_data is None and not force:
-        memobin_url = construct_memobin_url(
-            algorithm_name,
+    if not force:
+        cached_data = _read_local_metadata(
+            cache_dir,
             dataset_name,
+            algorithm_name,
             algorithm_version,
             dataset_version,
             system_version,
-            "metadata.json",
         )
+
+    # If not in local cache, try memobin (unless force flag is set)
+    if cached_data is None and not force and check_remote:
         if verbose:
             print("  Looking for cached result in memobin...")
-        cached_data = download_from_memobin(memobin_url)
-        if cached_data is not None:
-            if verbose:
-                print("  Found result in memobin, saving locally...")
-            # Save to local cache
-            os.makedirs(test_dir, exist_ok=True)
-            with open(metadata_file, "w") as f:
-                json.dump(cached_data, f, indent=2)
+        cached_data = _download_metadata(
+            cache_dir,
+            dataset_name,
+            algorithm_name,
+            algorithm_version,
+            dataset_version,
+            system_version,
+        )
+        if cached_data is not None and verbose:
+            print("  Found result in memobin, saved locally")
 
     if (
         cached_data is not None
@@ -89,13 +97,124 @@ def check_cached_result(
     return None
 
 
+def prefetch_cached_results(
+    cache_dir: str,
+    dataset_name: str,
+    dataset_version: str,
+    algorithms: List[Dict[str, Any]],
+    system_version: str,
+    max_workers: int = 16,
+) -> Set[str]:
+    """Query memobin concurrently for results missing from the local cache.
+
+    Results found in memobin are saved to the local cache, so that a subsequent
+    check_cached_result call finds them without another request.
+
+    Args:
+        cache_dir: Directory containing cached results
+        dataset_name: Name of the dataset
+        dataset_version: Version of the dataset
+        algorithms: Algorithm dictionaries to look up
+        system_version: Version of the system
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        Names of the algorithms that were looked up in memobin (found or not)
+    """
+    to_fetch = [
+        algorithm
+        for algorithm in algorithms
+        if _read_local_metadata(
+            cache_dir,
+            dataset_name,
+            algorithm["name"],
+            algorithm["version"],
+            dataset_version,
+            system_version,
+        )
+        is None
+    ]
+    if not to_fetch:
+        return set()
+
+    def fetch(algorithm: Dict[str, Any]) -> None:
+        _download_metadata(
+            cache_dir,
+            dataset_name,
+            algorithm["name"],
+            algorithm["version"],
+            dataset_version,
+            system_version,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(to_fetch))) as executor:
+        list(executor.map(fetch, to_fetch))
+    return {algorithm["name"] for algorithm in to_fetch}
+
+
+def _read_local_metadata(
+    cache_dir: str,
+    dataset_name: str,
+    algorithm_name: str,
+    algorithm_version: str,
+    dataset_version: str,
+    system_version: str,
+) -> Optional[Dict[str, Any]]:
+    """Read locally cached metadata, or None if missing or for other versions."""
+    test_dir = os.path.join(cache_dir, dataset_name, algorithm_name)
+    metadata_file = os.path.join(test_dir, "metadata.json")
+
+    cached_data = None
+    if os.path.exists(metadata_file):
+        with open(metadata_file, "rb") as f:
+            cached_data = _loads(f.read())
+            # if versions do not match, then set to None
+            if isinstance(cached_data, dict) and "result" in cached_data:
+                result = cached_data["result"]
+                if (
+                    result["algorithm_version"] != algorithm_version
+                    or result["dataset_version"] != dataset_version
+                    or result.get("system_version", "") != system_version
+                ):
+                    cached_data = None
+    return cached_data
+
+
+def _download_metadata(
+    cache_dir: str,
+    dataset_name: str,
+    algorithm_name: str,
+    algorithm_version: str,
+    dataset_version: str,
+    system_version: str,
+) -> Optional[Dict[str, Any]]:
+    """Download metadata from memobin, saving it to the local cache if found."""
+    memobin_url = construct_memobin_url(
+        algorithm_name,
+        dataset_name,
+        algorithm_version,
+        dataset_version,
+        system_version,
+        "metadata.json",
+    )
+    cached_data = download_from_memobin(memobin_url)
+    if cached_data is not None:
+        # Save to local cache
+        test_dir = os.path.join(cache_dir, dataset_name, algorithm_name)
+        os.makedirs(test_dir, exist_ok=True)
+        with open(os.path.join(test_dir, "metadata.json"), "wb") as f:
+            f.write(_dumps(cached_data))
+    return cached_data
+
+
 def save_result_to_cache(
     result: Dict[str, Any],
     encoded_data: bytes,
     cache_dir: str,
     dataset_name: str,
     algorithm_name: str,
-) -> None:
+    executor: Optional[Executor] = None,
+) -> Optional[Future]:
     """Save benchmark result and compressed data to cache.
 
     Args:
@@ -104,15 +223,71 @@ def save_result_to_cache(
         cache_dir: Directory to store cached results
         dataset_name: Name of the dataset
         algorithm_name: Name of the algorithm
+        executor: If given, the files are written in the background on this
+            executor and the returned future completes when they are written
+
+    Returns:
+        Future for the background write, or None if the files were written directly
     """
     test_dir = os.path.join(cache_dir, dataset_name, algorithm_name)
     metadata_file = os.path.join(test_dir, "metadata.json")
     compressed_file = os.path.join(test_dir, "compressed.dat")
 
-    os.makedirs(test_dir, exist_ok=True)
-    cache_data = {"result": result}
+    # Serialize now, so later changes to the result dict cannot race the write
+    metadata_bytes = _dumps({"result": result})
+
+    def write() -> None:
+        os.makedirs(test_dir, exist_ok=True)
+        # Write to temporary files so that an interrupted run leaves no partial
+        # file. metadata.json is written last, as its presence marks the result
+        # as cached.
+        for path, content in (
+            (compressed_file, encoded_data),
+            (metadata_file, metadata_bytes),
+        ):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+    if executor is not None:
+        return executor.submit(write)
+    write()
+    return None
+
+
+def get_dataset_path(cache_dir: str, dataset: Dict[str, Any]) -> str:
+    """Return the path of the cached dataset array."""
+    return os.path.join(cache_dir, dataset["name"], f"data_v{dataset['version']}.npy")
+
+
+def load_or_create_dataset(
+    cache_dir: str, dataset: Dict[str, Any], verbose: bool = True
+) -> np.ndarray:
+    """Load a dataset array from the local cache, creating and caching it if needed.
+
+    The array is stored as cache_dir/dataset_name/data_v{version}.npy and loaded
+    memory-mapped (read-only), so repeated runs neither regenerate nor copy it.
+
+    Args:
+        cache_dir: Directory to store cached results
+        dataset: Dataset dictionary
+        verbose: Whether to print progress messages
+
+    Returns:
+        The dataset array
+    """
+    data_path = get_dataset_path(cache_dir, dataset)
+    if os.path.exists(data_path):
+        if verbose:
+            print(f"  Loading cached dataset from {data_path}")
+        return np.load(data_path, mmap_mode="r")
 
-    with open(metadata_file, "w") as f:
-        json.dump(cache_data, f, indent=2)
-    with open(compressed_file, "wb") as f:
-        f.write(encoded_data)
+    data = dataset["create"]()
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    # Write to a temporary file so that an interrupted run leaves no partial file
+    tmp_path = data_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, data)
+    os.replace(tmp_path, data_path)
+    return data
@@ -5,6 +5,18 @@ GITHUB_ALGORITHMS_PREFIX = "https://github.com/magland/benchcompress/blob/main/b
 GITHUB_DATASETS_PREFIX = "https://github.com/magland/benchcompress/blob/main/benchcompress/src/benchcompress/datasets/"
 
 
+def _resolve_long_description(item: Dict[str, Any]) -> str:
+    """Get the long description of an algorithm or dataset.
+
+    Modules register a loader function rather than the text itself so that the
+    markdown file is only read when the info is actually collected.
+    """
+    long_description = item.get("long_description", "")
+    if callable(long_description):
+        long_description = long_description()
+    return long_description
+
+
 def collect_algorithm_info(algorithms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Collect information about compression algorithms.
 
@@ -19,7 +31,7 @@ def collect_algorithm_info(algorithms: List[Dict[str, Any]]) -> List[Dict[str, A
         info = {
             "name": algorithm["name"],
             "description": algorithm.get("description", ""),
-            "long_description": algorithm.get("long_description", ""),
+            "long_description": _resolve_long_description(algorithm),
             "version": algorithm["version"],
             "tags": algorithm.get("tags", []),
         }
@@ -43,7 +55,7 @@ def collect_dataset_info(datasets: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         info = {
             "name": dataset["name"],
             "description": dataset.get("description", ""),
-            "long_description": dataset.get("long_description", ""),
+            "long_description": _resolve_long_description(dataset),
             "version": dataset["version"],
             "tags": dataset.get("tags", []),
             "data_url_raw": construct_dataset_url(
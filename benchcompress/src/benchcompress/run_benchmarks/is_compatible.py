@@ -1,16 +1,26 @@
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet, Iterable
 
 
-def is_compatible(algorithm_tags: List[str], dataset_tags: List[str]) -> bool:
+def is_compatible(algorithm_tags: Iterable[str], dataset_tags: Iterable[str]) -> bool:
     """Check if an algorithm is compatible with a dataset based on their tags.
 
     Args:
-        algorithm_tags: List of tags for the algorithm
-        dataset_tags: List of tags for the dataset
+        algorithm_tags: Tags for the algorithm
+        dataset_tags: Tags for the dataset
 
     Returns:
         True if the algorithm should be applied to the dataset
     """
+    # frozenset() returns frozenset arguments as is, so callers can pass
+    # precomputed tag sets to skip the conversion
+    return _is_compatible(frozenset(algorithm_tags), frozenset(dataset_tags))
+
+
+@lru_cache(maxsize=None)
+def _is_compatible(
+    algorithm_tags: FrozenSet[str], dataset_tags: FrozenSet[str]
+) -> bool:
     # If algorithm has delta_encoding or markov_prediction, dataset must have continuous, timeseries, 1d, integer
     if "delta_encoding" in algorithm_tags or "markov_prediction" in algorithm_tags:
         if (
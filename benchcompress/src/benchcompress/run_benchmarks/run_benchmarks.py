@@ -1,5 +1,6 @@
 import os
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 import numpy as np
 
@@ -7,13 +8,114 @@ from ..algorithms import algorithms
 from ..datasets import datasets
 from ._memobin import construct_memobin_url, upload_to_memobin
 from .upload_dataset import upload_dataset_to_memobin
-from .cache_management import check_cached_result, save_result_to_cache
+from .cache_management import (
+    check_cached_result,
+    prefetch_cached_results,
+    save_result_to_cache,
+    get_dataset_path,
+    load_or_create_dataset,
+)
 from .benchmark_timing import run_compression_benchmark
 from .collect_info import collect_algorithm_info, collect_dataset_info
 from .is_compatible import is_compatible
 from .upload_benchmark_status import upload_benchmark_status
 
-system_version = "v6"
+system_version = "v7"
+
+
+def _run_cell(data_path: str, alg_name: str, verbose: bool):
+    """Benchmark one algorithm on one dataset in a worker process.
+
+    The dataset is memory-mapped from the cache file rather than pickled, so
+    the workers share its pages. The algorithm is looked up by name in the
+    registry because its lambdas cannot be pickled.
+    """
+    data = np.load(data_path, mmap_mode="r")
+    algorithm = next((a for a in algorithms if a["name"] == alg_name), None)
+    if algorithm is None:
+        raise ValueError(f"Algorithm {alg_name} is not registered")
+    return run_compression_benchmark(
+        data,
+        alg_name,
+        algorithm["encode"],
+        algorithm["decode"],
+        verbose,
+    )
+
+
+def _record_result(
+    result: Dict[str, Any],
+    encoded: bytes,
+    dataset: dict,
+    algorithm: dict,
+    results: List[Dict[str, Any]],
+    cache_dir: str,
+    memobin_api_key: Optional[str],
+    upload_enabled: bool,
+    verbose: bool,
+    io_pool: ThreadPoolExecutor,
+    write_futures: List[Future],
+    parallel: bool = False,
+) -> None:
+    """Add metadata to a benchmark result, then store, cache and upload it.
+
+    The cache files are written in the background on io_pool; the futures of
+    those writes are appended to write_futures. Results measured in the parallel
+    pool are marked as such and neither cached nor uploaded, since their
+    timings are skewed by the concurrent benchmarks.
+    """
+    alg_name = algorithm["name"]
+
+    # Add metadata to result
+    result.update(
+        {
+            "dataset": dataset["name"],
+            "algorithm": alg_name,
+            "algorithm_version": algorithm["version"],
+            "dataset_version": dataset["version"],
+            "system_version": system_version,
+        }
+    )
+    if parallel:
+        result["parallel"] = True
+    results.append(result)
+
+    if parallel:
+        print("  Result from parallel run (not cached or uploaded)")
+        return
+
+    # Save result and compressed data
+    write_future = save_result_to_cache(
+        result,
+        encoded,
+        cache_dir,
+        dataset["name"],
+        alg_name,
+        executor=io_pool,
+    )
+    if write_future is not None:
+        write_futures.append(write_future)
+    print(f"  Saving results to: {os.path.join(cache_dir, dataset['name'], alg_name)}")
+
+    # Upload to memobin if enabled
+    if memobin_api_key and upload_enabled:
+        try:
+            memobin_url = construct_memobin_url(
+                alg_name,
+                dataset["name"],
+                algorithm["version"],
+                dataset["version"],
+                system_version,
+            )
+            upload_to_memobin(
+                {"result": result},
+                memobin_url,
+                memobin_api_key,
+            )
+            if verbose:
+                print("  Successfully uploaded to memobin")
+        except Exception as e:
+            print(f"  Warning: Failed to upload to memobin: {str(e)}")
 
 
 def run_benchmarks(
@@ -28,6 +130,7 @@ def run_benchmarks(
     Results are stored in separate directories for each dataset/algorithm combination:
     cache_dir/
         dataset_name/
+            data_v{version}.npy  # The dataset array, so it is only created once
             algorithm_name/
                 metadata.json  # Contains algorithm version, dataset version, and results
                 compressed.dat # The actual compressed data
@@ -39,6 +142,15 @@ def run_benchmarks(
         selected_datasets: Optional list of specific datasets to run
         force: If True, ignore cached results
 
+    Set the environment variable BENCH_PARALLEL=1 to run the benchmarks in a pool
+    of worker processes (one per CPU). This reduces the wall time of a full run,
+    but concurrent benchmarks compete for memory bandwidth, so timings are less
+    precise than in the default sequential mode. Such results are marked with
+    "parallel": True in the returned results, but are not written to the cache
+    or uploaded individually, so every parallel run benchmarks those
+    combinations again. Multithreaded algorithms and algorithms missing from
+    the registry run in this process after the pool has finished.
+
     Returns:
         Dictionary containing benchmark results and metadata
     """
@@ -58,149 +170,228 @@ def run_benchmarks(
         selected_algorithms if selected_algorithms is not None else algorithms
     )
 
+    # Tag sets are computed once per algorithm and dataset
+    alg_tag_sets = [
+        frozenset(algorithm.get("tags", [])) for algorithm in algorithms_to_run
+    ]
+    dataset_tag_sets = [
+        frozenset(dataset.get("tags", [])) for dataset in datasets_to_run
+    ]
+
     # Calculate total number of benchmarks
     total_benchmarks = sum(
         1
-        for dataset in datasets_to_run
-        for algorithm in algorithms_to_run
-        if is_compatible(algorithm.get("tags", []), dataset.get("tags", []))
+        for dataset_tag_set in dataset_tag_sets
+        for alg_tag_set in alg_tag_sets
+        if is_compatible(alg_tag_set, dataset_tag_set)
     )
 
     # Run benchmarks for each dataset and algorithm combination
     memobin_api_key = os.environ.get("MEMOBIN_API_KEY")
     upload_enabled = os.environ.get("UPLOAD_TO_MEMOBIN") == "1"
 
-    for dataset in datasets_to_run:
-        dataset_tags = dataset.get("tags", [])
-        print(f"\n*** Dataset: {dataset['name']} (tags: {dataset_tags}) ***")
+    executor = (
+        ProcessPoolExecutor(max_workers=os.cpu_count())
+        if os.environ.get("BENCH_PARALLEL") == "1"
+        else None
+    )
+    pending = []  # (future, dataset, algorithm) for benchmarks run in the pool
+    deferred = []  # (dataset, algorithm) to run in this process after the pool
+
+    # Cache files are written in the background while the next benchmark runs
+    io_pool = ThreadPoolExecutor(max_workers=2)
+    write_futures: List[Future] = []
 
-        # only create the dataset if it is needed
-        data = None
+    try:
+        for dataset, dataset_tag_set in zip(datasets_to_run, dataset_tag_sets):
+            dataset_tags = dataset.get("tags", [])
+            print(f"\n*** Dataset: {dataset['name']} (tags: {dataset_tags}) ***")
 
-        for algorithm in algorithms_to_run:
-            alg_name = algorithm["name"]
-            alg_tags = algorithm.get("tags", [])
+            # only create the dataset if it is needed
+            data = None
 
-            # Skip if algorithm and dataset are not compatible based on tags
-            if not is_compatible(alg_tags, dataset_tags):
-                if verbose:
-                    print(
-                        f"\nSkipping algorithm {alg_name} (tags: {alg_tags}) - incompatible with dataset tags"
-                    )
-                continue
-
-            print(f"\nTesting algorithm: {alg_name} on dataset: {dataset['name']}")
-
-            # Upload current status to memobin if enabled (once per minute)
-            current_time = time.time()
-            if (
-                memobin_api_key
-                and upload_enabled
-                and (current_time - last_status_upload >= 60)
-            ):  # Check if 60 seconds have passed
-                try:
-                    upload_benchmark_status(
-                        memobin_api_key,
-                        dataset["name"],
-                        alg_name,
-                        results,
-                        total_benchmarks,
-                        start_time,
-                    )
-                    last_status_upload = current_time  # Update last upload time
-                except Exception as e:
-                    print(f"  Warning: Failed to upload status to memobin: {str(e)}")
+            # Look up the results missing from the local cache in memobin
+            # concurrently rather than one request per algorithm
+            remote_checked = set()
+            if not force:
+                remote_checked = prefetch_cached_results(
+                    cache_dir,
+                    dataset["name"],
+                    dataset["version"],
+                    [
+                        algorithm
+                        for algorithm, alg_tag_set in zip(
+                            algorithms_to_run, alg_tag_sets
+                        )
+                        if is_compatible(alg_tag_set, dataset_tag_set)
+                    ],
+                    system_version,
+                )
 
-            # Check if we can use cached result
-            cached_result = check_cached_result(
-                cache_dir,
-                dataset["name"],
-                alg_name,
-                algorithm["version"],
-                dataset["version"],
-                system_version,
-                force,
-                verbose,
-            )
+            for algorithm, alg_tag_set in zip(algorithms_to_run, alg_tag_sets):
+                alg_name = algorithm["name"]
+                alg_tags = algorithm.get("tags", [])
 
-            if cached_result is not None:
-                print("  Using cached result")
-                results.append(cached_result)
-                continue
-
-            print(f"  Running benchmark for {alg_name} on {dataset['name']}...")
-            if data is None:
-                data = dataset["create"]()
-                print(f"Created dataset: shape={data.shape}, dtype={data.dtype}")
-            else:
-                print("Dataset already created")
-
-            # Upload dataset to memobin if enabled
-            if memobin_api_key and upload_enabled:
-                try:
-                    upload_dataset_to_memobin(
-                        data,
-                        dataset["name"],
-                        dataset["version"],
-                        memobin_api_key,
-                        cache_dir,
-                        verbose,
-                    )
-                except Exception as e:
-                    print(f"  Warning: Failed to upload dataset to memobin: {str(e)}")
+                # Skip if algorithm and dataset are not compatible based on tags
+                if not is_compatible(alg_tag_set, dataset_tag_set):
+                    if verbose:
+                        print(
+                            f"\nSkipping algorithm {alg_name} (tags: {alg_tags}) - incompatible with dataset tags"
+                        )
+                    continue
 
-            # Run the benchmark
-            result, encoded = run_compression_benchmark(
-                data,
-                alg_name,
-                algorithm["encode"],
-                algorithm["decode"],
-                verbose,
-            )
+                print(f"\nTesting algorithm: {alg_name} on dataset: {dataset['name']}")
 
-            # Add metadata to result
-            result.update(
-                {
-                    "dataset": dataset["name"],
-                    "algorithm": alg_name,
-                    "algorithm_version": algorithm["version"],
-                    "dataset_version": dataset["version"],
-                    "system_version": system_version,
-                }
-            )
-            results.append(result)
+                # Upload current status to memobin if enabled (once per minute)
+                current_time = time.time()
+                if (
+                    memobin_api_key
+                    and upload_enabled
+                    and (current_time - last_status_upload >= 60)
+                ):  # Check if 60 seconds have passed
+                    try:
+                        upload_benchmark_status(
+                            memobin_api_key,
+                            dataset["name"],
+                            alg_name,
+                            results,
+                            total_benchmarks,
+                            start_time,
+                        )
+                        last_status_upload = current_time  # Update last upload time
+                    except Exception as e:
+                        print(
+                            f"  Warning: Failed to upload status to memobin: {str(e)}"
+                        )
 
-            # Save result and compressed data
-            save_result_to_cache(
-                result,
-                encoded,
-                cache_dir,
-                dataset["name"],
-                alg_name,
-            )
-            print(
-                f"  Results saved to: {os.path.join(cache_dir, dataset['name'], alg_name)}"
-            )
+                # Check if we can use cached result
+                cached_result = check_cached_result(
+                    cache_dir,
+                    dataset["name"],
+                    alg_name,
+                    algorithm["version"],
+                    dataset["version"],
+                    system_version,
+                    force,
+                    verbose,
+                    check_remote=alg_name not in remote_checked,
+                )
+
+                if cached_result is not None:
+                    print("  Using cached result")
+                    results.append(cached_result)
+                    continue
+
+                print(f"  Running benchmark for {alg_name} on {dataset['name']}...")
+                if data is None:
+                    data = load_or_create_dataset(cache_dir, dataset, verbose)
+                    print(f"Created dataset: shape={data.shape}, dtype={data.dtype}")
+                else:
+                    print("Dataset already created")
 
-            # Upload to memobin if enabled
-            if memobin_api_key and upload_enabled:
-                try:
-                    memobin_url = construct_memobin_url(
+                # Upload dataset to memobin if enabled
+                if memobin_api_key and upload_enabled:
+                    try:
+                        upload_dataset_to_memobin(
+                            data,
+                            dataset["name"],
+                            dataset["version"],
+                            memobin_api_key,
+                            verbose,
+                        )
+                    except Exception as e:
+                        print(
+                            f"  Warning: Failed to upload dataset to memobin: {str(e)}"
+                        )
+
+                # Run the benchmark. Multithreaded algorithms would oversubscribe
+                # the CPUs in the pool, and workers can only look up registered
+                # algorithms, so those run in this process once the pool is done.
+                if executor is not None:
+                    if "multithreaded" in alg_tag_set or algorithm not in algorithms:
+                        deferred.append((dataset, algorithm))
+                        continue
+                    future = executor.submit(
+                        _run_cell,
+                        get_dataset_path(cache_dir, dataset),
                         alg_name,
-                        dataset["name"],
-                        algorithm["version"],
-                        dataset["version"],
-                        system_version,
-                    )
-                    upload_to_memobin(
-                        {"result": result},
-                        memobin_url,
-                        memobin_api_key,
+                        verbose,
                     )
-                    if verbose:
-                        print("  Successfully uploaded to memobin")
-                except Exception as e:
-                    print(f"  Warning: Failed to upload to memobin: {str(e)}")
+                    pending.append((future, dataset, algorithm))
+                    continue
+                result, encoded = run_compression_benchmark(
+                    data,
+                    alg_name,
+                    algorithm["encode"],
+                    algorithm["decode"],
+                    verbose,
+                )
+                _record_result(
+                    result,
+                    encoded,
+                    dataset,
+                    algorithm,
+                    results,
+                    cache_dir,
+                    memobin_api_key,
+                    upload_enabled,
+                    verbose,
+                    io_pool,
+                    write_futures,
+                )
+
+        if executor is not None:
+            for future, dataset, algorithm in pending:
+                result, encoded = future.result()
+                _record_result(
+                    result,
+                    encoded,
+                    dataset,
+                    algorithm,
+                    results,
+                    cache_dir,
+                    memobin_api_key,
+                    upload_enabled,
+                    verbose,
+                    io_pool,
+                    write_futures,
+                    parallel=True,
+                )
+
+            # Run the remaining benchmarks with the CPUs to themselves
+            for dataset, algorithm in deferred:
+                print(
+                    f"\nTesting algorithm: {algorithm['name']} on dataset: {dataset['name']}"
+                )
+                data = np.load(get_dataset_path(cache_dir, dataset), mmap_mode="r")
+                result, encoded = run_compression_benchmark(
+                    data,
+                    algorithm["name"],
+                    algorithm["encode"],
+                    algorithm["decode"],
+                    verbose,
+                )
+                _record_result(
+                    result,
+                    encoded,
+                    dataset,
+                    algorithm,
+                    results,
+                    cache_dir,
+                    memobin_api_key,
+                    upload_enabled,
+                    verbose,
+                    io_pool,
+                    write_futures,
+                )
+
+        # Wait for the cache writes, raising any error that occurred
+        for write_future in write_futures:
+            write_future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        io_pool.shutdown()
 
     print("\n=== Benchmark Run Complete ===\n")
 
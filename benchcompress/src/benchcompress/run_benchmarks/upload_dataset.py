@@ -1,4 +1,4 @@
-import os
+import io
 import numpy as np
 from ._memobin import (
     construct_dataset_url,
@@ -12,7 +12,6 @@ def upload_dataset_to_memobin(
     dataset_name: str,
     dataset_version: str,
     memobin_api_key: str,
-    cache_dir: str,
     verbose: bool = True,
 ) -> None:
     """Upload dataset to memobin in multiple formats.
@@ -22,10 +21,13 @@ def upload_dataset_to_memobin(
         dataset_name: Name of the dataset
         dataset_version: Version of the dataset
         memobin_api_key: API key for memobin
-        cache_dir: Directory for temporary files
         verbose: Whether to print progress messages
     """
     try:
+        data = np.ascontiguousarray(data)
+        # The raw bytes are shared by the .dat and .npy uploads
+        raw_bytes = None
+
         # Upload array metadata as JSON
         dataset_url_json = construct_dataset_url(dataset_name, dataset_version, "json")
         if not exists_in_memobin(dataset_url_json):
@@ -46,8 +48,9 @@ def upload_dataset_to_memobin(
         if not exists_in_memobin(dataset_url_raw):
             if verbose:
                 print("  Uploading dataset (raw) to memobin...")
+            raw_bytes = data.tobytes()
             upload_to_memobin(
-                data.tobytes(),
+                raw_bytes,
                 dataset_url_raw,
                 memobin_api_key,
                 content_type="application/octet-stream",
@@ -60,12 +63,14 @@ def upload_dataset_to_memobin(
         if not exists_in_memobin(dataset_url_npy):
             if verbose:
                 print("  Uploading dataset (npy) to memobin...")
-            # Save array to a temporary .npy file
-            temp_npy = os.path.join(cache_dir, "temp.npy")
-            np.save(temp_npy, data)
-            with open(temp_npy, "rb") as f:
-                npy_bytes = f.read()
-            os.remove(temp_npy)  # Clean up temp file
+            # A .npy file is a header followed by the raw array bytes
+            header = io.BytesIO()
+            np.lib.format.write_array_header_1_0(
+                header, np.lib.format.header_data_from_array_1_0(data)
+            )
+            if raw_bytes is None:
+                raw_bytes = data.tobytes()
+            npy_bytes = header.getvalue() + raw_bytes
 
             upload_to_memobin(
                 npy_bytes,
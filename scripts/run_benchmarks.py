@@ -25,7 +25,10 @@ def main():
     memobin_api_key = os.environ.get("MEMOBIN_API_KEY")
     upload_enabled = os.environ.get("UPLOAD_TO_MEMOBIN") == "1"
 
-    if memobin_api_key and upload_enabled:
+    # Timings from a BENCH_PARALLEL=1 run are skewed by the concurrent benchmarks
+    if any(r.get("parallel") for r in results["results"]):
+        print("Not uploading results to memobin: they include parallel-run timings")
+    elif memobin_api_key and upload_enabled:
         try:
             # Construct URL for the global results file
             url = "https://tempory.net/f/memobin/benchcompress/global/results.json"